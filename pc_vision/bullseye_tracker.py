@@ -4,21 +4,825 @@ import numpy as np
 import requests
 import time
 import math
+import os
+import sys
+import threading
+import queue
+from abc import ABC, abstractmethod
+import multiprocessing as mp
+from multiprocessing import shared_memory
 
 # YOLO modelini yükle
-model = YOLO("models/best.pt")
+MODEL_PATH = "models/best.pt"
+model = YOLO(MODEL_PATH)
+
+def bullseye_boxes_from_results(results, class_name, offset_x=0, offset_y=0):
+    """YOLO sonuçlarından bullseye kutuları [(x1, y1, x2, y2, güven)] - offset ile kaydırılmış"""
+    boxes_out = []
+    
+    for result in results:
+        boxes = result.boxes
+        if boxes is not None:
+            for box in boxes:
+                class_id = int(box.cls[0])
+                name = model.names[class_id]
+                confidence = float(box.conf[0])
+                
+                if name.lower() == class_name.lower() or "bullseye" in name.lower():
+                    x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
+                    boxes_out.append((float(x1) + offset_x, float(y1) + offset_y,
+                                      float(x2) + offset_x, float(y2) + offset_y, confidence))
+    
+    return boxes_out
+
+def infer_bullseye_boxes(frame, conf, class_name, imgsz=None, roi=None):
+    """YOLO çıkarımı - bullseye kutuları [(x1, y1, x2, y2, güven)], tam kare koordinatında"""
+    offset_x, offset_y = 0, 0
+    source = frame
+    if roi is not None:
+        offset_x, offset_y, roi_w, roi_h = roi
+        source = frame[offset_y:offset_y + roi_h, offset_x:offset_x + roi_w]
+    
+    if imgsz is not None:
+        results = model(source, conf=conf, imgsz=imgsz, verbose=False)
+    else:
+        results = model(source, conf=conf, verbose=False)
+    
+    return bullseye_boxes_from_results(results, class_name, offset_x, offset_y)
+
+def tile_origins(length, tile_size, overlap):
+    """Bir eksen boyunca örtüşen karoların başlangıç noktaları"""
+    if length <= tile_size:
+        return [0]
+    stride = tile_size - overlap
+    count = int(math.ceil((length - overlap) / float(stride)))
+    step = (length - tile_size) / float(count - 1)
+    return [int(round(i * step)) for i in range(count)]
+
+def merge_tiled_boxes(boxes, overlap_threshold=0.6):
+    """Karolar arası birleştirme - küçük kutunun büyük kutuyla kesişimi (IoS) ile"""
+    # Karo sınırını kesen hedef kenar karolarında kırpılmış yarım kutu olarak da görülür.
+    # Yarım kutunun tam kutuyla IoU'su ~0.5 olduğundan NMS onu elemez, IoS ise ~1.0 olur.
+    # Büyükten küçüğe - tam kutu kırpılmış parçalarından önce tutulur
+    ordered = sorted(boxes, key=lambda b: (b[2] - b[0]) * (b[3] - b[1]), reverse=True)
+    kept = []
+    for box in ordered:
+        x1, y1, x2, y2, _ = box
+        area = max(0.0, x2 - x1) * max(0.0, y2 - y1)
+        duplicate = False
+        for kx1, ky1, kx2, ky2, _ in kept:
+            inter_w = min(x2, kx2) - max(x1, kx1)
+            inter_h = min(y2, ky2) - max(y1, ky1)
+            if inter_w > 0 and inter_h > 0 and area > 0 and inter_w * inter_h / area >= overlap_threshold:
+                duplicate = True
+                break
+        if not duplicate:
+            kept.append(box)
+    return kept
+
+def infer_bullseye_boxes_tiled(frame, conf, class_name, tile_size=640, imgsz=None, overlap=128):
+    """Karo tarama - kare örtüşen karolara bölünür, tek batch'te çıkarım, karolar arası birleştirme"""
+    frame_h, frame_w = frame.shape[:2]
+    tiles = []
+    origins = []
+    for y in tile_origins(frame_h, tile_size, overlap):
+        for x in tile_origins(frame_w, tile_size, overlap):
+            tiles.append(frame[y:y + tile_size, x:x + tile_size])
+            origins.append((x, y))
+    
+    # imgsz == tile_size ise karolar doğal çözünürlükte - küçük hedefler küçültülmeden görülür
+    results = model(tiles, conf=conf, imgsz=imgsz or tile_size, verbose=False)
+    
+    boxes = []
+    for result, (x, y) in zip(results, origins):
+        boxes.extend(bullseye_boxes_from_results([result], class_name, x, y))
+    
+    if len(boxes) <= 1:
+        return boxes
+    
+    return merge_tiled_boxes(boxes)
+
+def _inference_worker(frame_shm_name, result_shm_name, num_slots, height, width, max_detections,
+                      num_workers, request_queue, result_queue):
+    """Çıkarım işçi süreci - kareleri paylaşılan bellekten okur, sonuçları sabit boyutlu kayıtlara yazar"""
+    # Her işçi varsayılan olarak tüm çekirdekleri kullanır - çekirdekleri işçiler arasında paylaştır
+    import torch
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // num_workers))
+    
+    frame_shm = shared_memory.SharedMemory(name=frame_shm_name)
+    result_shm = shared_memory.SharedMemory(name=result_shm_name)
+    frames = np.ndarray((num_slots, height, width, 3), dtype=np.uint8, buffer=frame_shm.buf)
+    records = np.ndarray((num_slots, max_detections, 5), dtype=np.float32, buffer=result_shm.buf)
+    
+    try:
+        while True:
+            request = request_queue.get()
+            if request is None:
+                break
+            slot, frame_id, conf, class_name, imgsz, roi, tiles = request
+            
+            start = time.monotonic()
+            if tiles is not None:
+                tile_size, tile_imgsz = tiles
+                boxes = infer_bullseye_boxes_tiled(frames[slot], conf, class_name, tile_size, tile_imgsz)
+            else:
+                boxes = infer_bullseye_boxes(frames[slot], conf, class_name, imgsz, roi)
+            count = min(len(boxes), max_detections)
+            if count:
+                records[slot, :count] = boxes[:count]
+            result_queue.put((slot, frame_id, count, time.monotonic() - start))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        del frames, records
+        frame_shm.close()
+        result_shm.close()
+
+class InferenceWorkerPool:
+    """Çok süreçli çıkarım - paylaşılan bellek halkasıyla kareler kopyalanmadan (pickle yok) gönderilir"""
+    def __init__(self, num_workers=2, num_slots=None, max_detections=16):
+        self.num_workers = num_workers
+        # İşçi başına 1 slot - kareler meşgul işçilerin arkasında kuyrukta eskimez
+        self.num_slots = num_slots or num_workers
+        self.max_detections = max_detections
+        
+        # Halka ilk karenin boyutuyla ayrılır - kamera 1280x720 vermezse de çalışır
+        self.frame_shape = None
+        self.shape_warned = False
+        self.workers = []
+        self.failed = False  # Bir işçi süreci öldü - ana süreçte çıkarıma dönülmeli
+        
+        # İstatistikler
+        self.next_frame_id = 0
+        self.submitted = 0
+        self.dropped = 0
+        self.completed = 0
+        self.total_infer_time = 0.0
+        
+    def _start(self, frame_shape):
+        """Kare halkasını ve işçi süreçlerini ilk karenin boyutuyla başlat"""
+        height, width = frame_shape[:2]
+        self.frame_shape = (height, width, 3)
+        
+        # Önceden ayrılmış kare halkası (slot x yükseklik x genişlik x 3) ve sonuç kayıtları
+        self.frame_shm = shared_memory.SharedMemory(create=True, size=self.num_slots * height * width * 3)
+        self.result_shm = shared_memory.SharedMemory(create=True, size=self.num_slots * self.max_detections * 5 * 4)
+        self.frames = np.ndarray((self.num_slots, height, width, 3), dtype=np.uint8, buffer=self.frame_shm.buf)
+        self.records = np.ndarray((self.num_slots, self.max_detections, 5), dtype=np.float32,
+                                  buffer=self.result_shm.buf)
+        self.free_slots = list(range(self.num_slots))
+        
+        # spawn - torch/CUDA durumunu fork ile kopyalamamak için
+        ctx = mp.get_context("spawn")
+        self.request_queue = ctx.Queue()
+        self.result_queue = ctx.Queue()
+        for _ in range(self.num_workers):
+            worker = ctx.Process(target=_inference_worker,
+                                 args=(self.frame_shm.name, self.result_shm.name, self.num_slots,
+                                       height, width, self.max_detections, self.num_workers,
+                                       self.request_queue, self.result_queue),
+                                 daemon=True)
+            worker.start()
+            self.workers.append(worker)
+        
+        print(f"🧵 Çıkarım işçileri başlatıldı: {self.num_workers} süreç, {self.num_slots} slot ({width}x{height})")
+    
+    def accepts(self, frame):
+        """Kare halkaya sığıyor mu - boyut değiştiyse bir kez uyar"""
+        if self.failed:
+            return False
+        if self.frame_shape is None or frame.shape == self.frame_shape:
+            return True
+        if not self.shape_warned:
+            self.shape_warned = True
+            print(f"⚠️ Kare boyutu {frame.shape[1]}x{frame.shape[0]}, işçi halkası "
+                  f"{self.frame_shape[1]}x{self.frame_shape[0]} - ana süreçte çıkarım yapılıyor")
+        return False
+    
+    def submit(self, frame, conf, class_name, imgsz=None, roi=None, tiles=None):
+        """Kareyi boş slota kopyala ve işçiye gönder - boş slot yoksa kareyi atla"""
+        if self.frame_shape is None:
+            self._start(frame.shape)
+        if not self.free_slots or frame.shape != self.frame_shape:
+            self.dropped += 1
+            return None
+        slot = self.free_slots.pop()
+        np.copyto(self.frames[slot], frame)
+        frame_id = self.next_frame_id
+        self.next_frame_id += 1
+        self.request_queue.put((slot, frame_id, conf, class_name, imgsz, roi, tiles))
+        self.submitted += 1
+        return frame_id
+    
+    def collect(self):
+        """Tamamlanan sonuçları al - [(frame_id, kutular, süre)], eskiden yeniye"""
+        completed = []
+        if self.frame_shape is not None and not self.failed:
+            dead = [worker for worker in self.workers if not worker.is_alive()]
+            if dead:
+                self.failed = True
+                print(f"⚠️ {len(dead)}/{self.num_workers} çıkarım işçisi durdu "
+                      f"(çıkış kodu {dead[0].exitcode}) - ana süreçte çıkarım yapılıyor")
+        while self.frame_shape is not None:
+            try:
+                slot, frame_id, count, infer_time = self.result_queue.get_nowait()
+            except queue.Empty:
+                break
+            boxes = [tuple(float(v) for v in row) for row in self.records[slot, :count]]
+            self.free_slots.append(slot)
+            self.completed += 1
+            self.total_infer_time += infer_time
+            completed.append((frame_id, boxes, infer_time))
+        completed.sort(key=lambda item: item[0])
+        return completed
+    
+    def close(self):
+        """İşçileri durdur ve paylaşılan belleği serbest bırak"""
+        if self.frame_shape is None:
+            return
+        for _ in self.workers:
+            self.request_queue.put(None)
+        for worker in self.workers:
+            worker.join(timeout=2.0)
+            if worker.is_alive():
+                worker.terminate()
+        
+        avg_ms = self.total_infer_time / self.completed * 1000 if self.completed else 0.0
+        print(f"🧵 Çıkarım işçileri: {self.completed}/{self.submitted} kare işlendi, "
+              f"{self.dropped} kare atlandı, ortalama {avg_ms:.1f}ms")
+        
+        del self.frames, self.records
+        self.frame_shm.close()
+        self.frame_shm.unlink()
+        self.result_shm.close()
+        self.result_shm.unlink()
+
+class InferenceScheduler:
+    """Kare başına gecikme bütçesine göre çıkarım boyutu ve ROI seçimi"""
+    def __init__(self, frame_budget=1.0 / 30, imgsz_levels=(320, 480, 640, 960)):
+        self.frame_budget = frame_budget  # Kare başına gecikme bütçesi (saniye)
+        self.imgsz_levels = imgsz_levels  # 32'nin katı olmalı
+        
+        # Bütçe aşımında düşürülen, bütçe altında kademeli yükseltilen üst sınır
+        self.level_cap = len(imgsz_levels) - 1
+        self.recover_frames = 15  # Üst sınırı yükseltmek için gereken ardışık rahat kare
+        self.under_budget_streak = 0
+        # Arama modu alt sınırı - bütçe aşılsa da varsayılan 640'ın altına inilmez
+        self.search_min_level = min(2, len(imgsz_levels) - 1)
+        
+        # Hedef boyutuna göre imgsz eşikleri (piksel)
+        self.large_target_size = 160
+        self.medium_target_size = 80
+        
+        # ROI parametreleri
+        self.roi_scale = 3.0          # ROI = hedef kutusunun 3 katı
+        self.roi_min_size = 320       # Minimum ROI kenarı
+        self.roi_refresh_interval = 15  # Her 15 karede bir tam kare tara
+        self.frames_since_full = 0
+        self.boost = False  # Sonraki karede bir seviye yukarı (örn. servo yerleştikten sonra)
+        self.boosted_frame = False  # Bu kare yükseltilmiş - bütçe aşımı üst sınırı düşürmez
+        
+        # Karo tarama düzeni - seviye sınırına göre (karo boyutu, imgsz), None = karo yok
+        # 640 -> 1280x720 için 3x2=6 karo doğal çözünürlükte, 960 -> 2 karo 1.5x küçültülmüş
+        self.tile_layouts = (None, None, (960, 640), (640, 640))
+        
+        # Kare zamanlama
+        self.frame_start = None
+        self.last_frame_time = 0.0
+        self.over_budget = False
+        
+        # İstatistikler
+        self.frame_count = 0
+        self.budget_misses = 0
+        self.fps = 0.0
+        self.window_start = time.monotonic()
+        self.window_frames = 0
+        self.report_interval = 5.0
+        self.last_report_time = time.monotonic()
+        self.last_imgsz = imgsz_levels[-1]
+        self.last_full_imgsz = imgsz_levels[-1]  # ROI kısıtlaması öncesi tam kare imgsz'i
+        self.last_use_roi = False
+    
+    def begin_frame(self):
+        """Kare işleme süresini ölçmeye başla"""
+        self.frame_start = time.monotonic()
+        self.boosted_frame = False
+    
+    def end_frame(self):
+        """Kare süresini kaydet, bütçe aşımını ve FPS'i güncelle - rapor basıldıysa True"""
+        now = time.monotonic()
+        self.last_frame_time = now - self.frame_start
+        self.frame_count += 1
+        self.window_frames += 1
+        
+        self.over_budget = self.last_frame_time > self.frame_budget
+        if self.over_budget:
+            self.budget_misses += 1
+            if not self.boosted_frame:
+                self.under_budget_streak = 0
+                self.level_cap = max(0, self.level_cap - 1)
+        else:
+            self.under_budget_streak += 1
+            if self.under_budget_streak >= self.recover_frames:
+                self.under_budget_streak = 0
+                self.level_cap = min(len(self.imgsz_levels) - 1, self.level_cap + 1)
+        
+        elapsed = now - self.window_start
+        if elapsed >= 1.0:
+            self.fps = self.window_frames / elapsed
+            self.window_start = now
+            self.window_frames = 0
+        
+        if now - self.last_report_time >= self.report_interval:
+            self.last_report_time = now
+            print(f"⏱️ FPS: {self.fps:.1f} | Bütçe: {self.frame_budget * 1000:.0f}ms | "
+                  f"Son kare: {self.last_frame_time * 1000:.1f}ms | "
+                  f"Bütçe aşımı: {self.budget_misses}/{self.frame_count} | imgsz: {self.last_imgsz}")
+            return True
+        return False
+    
+    def plan(self, target_box, target_locked, frame_shape):
+        """Bu kare için (imgsz, roi) seç - roi None ise tam kare"""
+        if target_box is None:
+            # Arama modu - bütçe izin verdiği kadar büyük, en az varsayılan çözünürlük
+            level = max(self.search_min_level, self.level_cap)
+        else:
+            size = max(target_box[2], target_box[3])
+            if target_locked and size >= self.large_target_size:
+                level = 0
+            elif size >= self.medium_target_size:
+                level = 1
+            else:
+                level = 2
+            level = min(level, self.level_cap)
+        if self.boost:
+            # Atlanan karelerden kalan süre - planın bir seviye üstü, üst sınırı aşmadan
+            self.boost = False
+            self.boosted_frame = True
+            level = max(level, min(level + 1, self.level_cap))
+        imgsz = self.imgsz_levels[level]
+        self.last_full_imgsz = imgsz
+        
+        roi = None
+        self.frames_since_full += 1
+        if target_box is not None and target_locked and self.frames_since_full < self.roi_refresh_interval:
+            roi = self.target_roi(target_box, frame_shape)
+            # ROI'den büyük imgsz gereksiz - 32'nin katına yuvarla
+            roi_side = max(roi[2], roi[3])
+            imgsz = min(imgsz, int(math.ceil(roi_side / 32.0)) * 32)
+        else:
+            self.frames_since_full = 0
+        
+        self.last_imgsz = imgsz
+        self.last_use_roi = roi is not None
+        return imgsz, roi
+    
+    def plan_native_roi(self, target_box, frame_shape):
+        """Küçük, kilitsiz hedef - ROI doğal çözünürlükte (küçültmeden) taranır"""
+        roi = self.target_roi(target_box, frame_shape)
+        imgsz = int(math.ceil(max(roi[2], roi[3]) / 32.0)) * 32
+        self.boost = False
+        self.last_imgsz = imgsz
+        self.last_use_roi = True
+        return imgsz, roi
+    
+    def tile_plan(self):
+        """Bütçeye göre karo düzeni (karo boyutu, imgsz) - bütçe dar ise None"""
+        return self.tile_layouts[min(self.level_cap, len(self.tile_layouts) - 1)]
+    
+    def boost_next_frame(self):
+        """Sonraki karede bir seviye büyük imgsz kullan (kilitliyken ROI korunur)"""
+        self.boost = True
+    
+    def force_full_frame(self):
+        """Sonraki planda ROI yerine tam kare tara"""
+        self.frames_since_full = self.roi_refresh_interval
+    
+    def target_roi(self, target_box, frame_shape):
+        """Hedef kutusu etrafında kare sınırlarına kırpılmış ROI (x, y, w, h)"""
+        frame_h, frame_w = frame_shape[:2]
+        x, y, w, h = target_box
+        side = max(self.roi_min_size, int(max(w, h) * self.roi_scale))
+        roi_w = min(frame_w, side)
+        roi_h = min(frame_h, side)
+        cx = x + w // 2
+        cy = y + h // 2
+        roi_x = max(0, min(frame_w - roi_w, cx - roi_w // 2))
+        roi_y = max(0, min(frame_h - roi_h, cy - roi_h // 2))
+        return (roi_x, roi_y, roi_w, roi_h)
+    
+    def should_draw_hud(self):
+        """Bütçe aşıldıysa opsiyonel HUD çizimini atla"""
+        return not self.over_budget
+
+class DetectionCache:
+    """Değişmeyen karelerde son tespit sonucunu yeniden kullan - hedef bölgesindeki piksel farkı ile"""
+    def __init__(self, pixel_threshold=16, changed_fraction=0.01, margin=0.25, size=(64, 64), max_age=1.0):
+        # Ortalama fark yerine değişen piksel sayısı - hedefin birkaç piksel kayması da ıska sayılır
+        self.pixel_threshold = pixel_threshold    # Piksel değişti sayılan gri seviye farkı (0-255)
+        self.changed_fraction = changed_fraction  # İmzada izin verilen değişen piksel oranı
+        self.margin = margin        # Hedef kutusu çevresindeki pay (kutu boyutunun oranı)
+        self.size = size            # Karşılaştırma çözünürlüğü
+        self.max_age = max_age      # Önbellek en fazla bu kadar süre kullanılır (s)
+        
+        self.reference = None       # Tespitin yapıldığı karenin küçük gri imzası
+        self.roi = None
+        self.detections = None
+        self.zoom_level = None
+        self.stored_time = 0.0
+        
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.avg_infer_time = 0.0   # Kilitli ROI çıkarım süresinin hareketli ortalaması
+        self.saved_time = 0.0       # Atlanan çıkarımların tahmini toplam süresi
+    
+    def region(self, target_box, frame_shape):
+        """Hedef kutusu ve küçük bir pay - imza hedef ölçeğinde alınır (x, y, w, h)"""
+        frame_h, frame_w = frame_shape[:2]
+        x, y, w, h = target_box
+        pad = int(max(w, h) * self.margin)
+        x0 = max(0, min(frame_w - 1, x - pad))
+        y0 = max(0, min(frame_h - 1, y - pad))
+        x1 = max(x0 + 1, min(frame_w, x + w + pad))
+        y1 = max(y0 + 1, min(frame_h, y + h + pad))
+        return (x0, y0, x1 - x0, y1 - y0)
+    
+    def signature(self, frame, roi):
+        """ROI'nin küçültülmüş gri görüntüsü"""
+        x, y, w, h = roi
+        gray = cv2.cvtColor(frame[y:y + h, x:x + w], cv2.COLOR_BGR2GRAY)
+        return cv2.resize(gray, self.size, interpolation=cv2.INTER_AREA)
+    
+    def invalidate(self):
+        """Servo komutu veya zoom değişiminde önbelleği boşalt"""
+        self.reference = None
+        self.detections = None
+    
+    def lookup(self, frame, zoom_level, timestamp):
+        """Kare değişmediyse önbellekteki tespitleri döndür, değiştiyse None"""
+        if (self.detections is None or zoom_level != self.zoom_level or
+                timestamp - self.stored_time > self.max_age):
+            self.misses += 1
+            return None
+        
+        diff = cv2.absdiff(self.signature(frame, self.roi), self.reference)
+        if np.count_nonzero(diff > self.pixel_threshold) > self.changed_fraction * diff.size:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self.saved_time += self.avg_infer_time
+        return self.detections
+    
+    def store(self, reference, roi, detections, zoom_level, timestamp):
+        """Yeni çıkarım sonucunu referans imzası ile kaydet"""
+        self.reference = reference
+        self.roi = roi
+        self.detections = detections
+        self.zoom_level = zoom_level
+        self.stored_time = timestamp
+    
+    def record_inference_time(self, infer_time):
+        self.avg_infer_time = infer_time if self.avg_infer_time == 0.0 else 0.9 * self.avg_infer_time + 0.1 * infer_time
+    
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class HudOverlay:
+    """Saklı mod HUD katmanı - statik öğeler bir kez, dinamik alanlar sadece değer değişince çizilir"""
+    def __init__(self, width, height, scale=1.0):
+        self.width = width
+        self.height = height
+        self.scale = scale  # Kaynak (kamera) koordinatlarından gösterim koordinatlarına
+        self.font = cv2.FONT_HERSHEY_SIMPLEX
+        
+        # BGRA katmanlar - alfa > 0 olan pikseller kareye kopyalanır
+        self.static_layer = np.zeros((height, width, 4), dtype=np.uint8)
+        self.layer = self.static_layer.copy()
+        # Bindirme tamponları (sürekli BGR + 8 bit maske) - sadece değişen bölgelerde güncellenir
+        self.color = np.zeros((height, width, 3), dtype=np.uint8)
+        self.mask = np.zeros((height, width), dtype=np.uint8)
+        self.fields = {}  # anahtar -> (içerik, dikdörtgen, çizim parametreleri)
+        self.renders = 0  # Yeniden çizilen alan sayısı
+    
+    def _point(self, point):
+        return (int(round(point[0] * self.scale)), int(round(point[1] * self.scale)))
+    
+    def _thickness(self, thickness):
+        return max(1, int(round(thickness * self.scale)))
+    
+    def static_text(self, text, org, font_scale, color, thickness):
+        cv2.putText(self.static_layer, text, self._point(org), self.font,
+                    font_scale * self.scale, (*color, 255), self._thickness(thickness))
+    
+    def static_line(self, pt1, pt2, color, thickness):
+        cv2.line(self.static_layer, self._point(pt1), self._point(pt2), (*color, 255), self._thickness(thickness))
+    
+    def finish_static(self):
+        """Statik katmanı dinamik alanların tabanı yap"""
+        self.layer = self.static_layer.copy()
+        self.fields = {}
+        self._sync((0, 0, self.width, self.height))
+    
+    def _sync(self, rect):
+        """Katmanın bir bölgesini bindirme tamponlarına aktar"""
+        x, y, w, h = rect
+        region = self.layer[y:y + h, x:x + w]
+        self.color[y:y + h, x:x + w] = region[..., :3]
+        self.mask[y:y + h, x:x + w] = np.where(region[..., 3] > 0, 255, 0)
+    
+    def _redraw(self, rect):
+        """Bölgeyi statik katmana döndür ve kesişen tüm alanları (komşular dahil) yeniden çiz"""
+        x, y, w, h = rect
+        if w <= 0 or h <= 0:
+            return
+        # Bölge görünümüne çizim - dikdörtgen dışındaki pikseller değişmez
+        region = self.layer[y:y + h, x:x + w]
+        region[...] = self.static_layer[y:y + h, x:x + w]
+        for _, (fx, fy, fw, fh), (text, (tx, ty), scale, color, t) in self.fields.values():
+            if fx < x + w and x < fx + fw and fy < y + h and y < fy + fh:
+                cv2.putText(region, text, (tx - x, ty - y), self.font, scale, color, t)
+        self._sync(rect)
+    
+    def set_text(self, key, fmt, values, org, font_scale, color, thickness, align="left"):
+        """Dinamik yazı alanı - içerik aynıysa hiçbir şey yapma (format dahil)"""
+        content = (fmt, values, org, font_scale, color, thickness, align)
+        field = self.fields.get(key)
+        if field is not None and field[0] == content:
+            return
+        
+        text = fmt.format(*values)
+        scale = font_scale * self.scale
+        t = self._thickness(thickness)
+        (text_w, text_h), baseline = cv2.getTextSize(text, self.font, scale, t)
+        x, y = self._point(org)
+        if align == "right":
+            x -= text_w
+        
+        # Alanın dikdörtgeni - sonraki değişimde sadece bu bölge (ve kesişen komşular) yeniden çizilir
+        x0 = max(0, x - t - 1)
+        y0 = max(0, y - text_h - t - 1)
+        x1 = min(self.width, x + text_w + t + 1)
+        y1 = min(self.height, y + baseline + t + 1)
+        rect = (x0, y0, max(0, x1 - x0), max(0, y1 - y0))
+        self.fields[key] = (content, rect, (text, (x, y), scale, (*color, 255), t))
+        if field is not None:
+            self._redraw(field[1])
+        self._redraw(rect)
+        self.renders += 1
+    
+    def hide(self, key):
+        field = self.fields.pop(key, None)
+        if field is not None:
+            self._redraw(field[1])
+    
+    def set_lines(self, group, lines):
+        """Satır grubu [(fmt, değerler, konum, ölçek, renk, kalınlık)] - fazla eski satırlar gizlenir"""
+        for index, (fmt, values, org, font_scale, color, thickness) in enumerate(lines):
+            self.set_text((group, index), fmt, values, org, font_scale, color, thickness)
+        stale = [key for key in self.fields
+                 if isinstance(key, tuple) and key[0] == group and key[1] >= len(lines)]
+        for key in stale:
+            self.hide(key)
+    
+    def composite(self, frame):
+        """Katmanı kareye tek maskeli kopya ile bindir"""
+        cv2.copyTo(self.color, self.mask, frame)
+        return frame
+
+class FrameSource(ABC):
+    """Kare kaynağı arayüzü - read() -> (ret, frame, monotonic zaman damgası)"""
+    def isOpened(self):
+        return True
+    
+    @abstractmethod
+    def read(self):
+        """(ret, frame, monotonic zaman damgası) döndür"""
+    
+    def release(self):
+        pass
+
+class CameraSource(FrameSource):
+    """Düşük gecikmeli kamera yakalama - backend/format seçimi, tek kare tampon, en son kare"""
+    BACKENDS = {
+        "any": cv2.CAP_ANY,
+        "v4l2": cv2.CAP_V4L2,
+        "dshow": cv2.CAP_DSHOW,
+        "msmf": cv2.CAP_MSMF,
+    }
+    
+    def __init__(self, camera_index=1, width=1280, height=720, fps=30, backend="v4l2",
+                 fourcc="MJPG", buffer_size=1, grab_latest=True, exposure=None):
+        self.camera_index = camera_index
+        self.backend = backend
+        self.grab_latest = grab_latest
+        self.stopped = False
+        self.thread = None
+        self.release_pending = False  # Thread grab() içindeyken release() çağrıldı
+        
+        self.cap = cv2.VideoCapture(camera_index, self.BACKENDS.get(backend, cv2.CAP_ANY))
+        if not self.cap.isOpened() and backend != "any":
+            print(f"⚠️ {backend.upper()} backend açılamadı, varsayılan backend deneniyor...")
+            self.backend = "any"
+            self.cap = cv2.VideoCapture(camera_index, cv2.CAP_ANY)
+        if not self.cap.isOpened():
+            return
+        
+        # Format önce ayarlanmalı - MJPEG 1280x720'de ham YUYV'den daha yüksek FPS verir
+        if fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.cap.set(cv2.CAP_PROP_FPS, fps)
+        # Sürücü tamponunda bekleyen eski kareleri azalt
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+        
+        # Pozlama sınırı - hareket bulanıklığını ve kare süresi uzamasını engeller
+        # (değer birimi backend'e bağlı, V4L2'de 100μs birimi)
+        if exposure is not None:
+            self.cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, 1 if self.backend == "v4l2" else 0.25)
+            self.cap.set(cv2.CAP_PROP_EXPOSURE, exposure)
+        
+        actual_fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc_text = "".join(chr((actual_fourcc >> (8 * i)) & 0xFF) for i in range(4))
+        print(f"📷 Yakalama: {self.backend.upper()} | {fourcc_text} | "
+              f"{int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))} "
+              f"@ {self.cap.get(cv2.CAP_PROP_FPS):.0f}fps | Tampon: {buffer_size} | "
+              f"En son kare: {'AÇIK' if grab_latest else 'KAPALI'}")
+        
+        # En son kare modu - arka plan thread'i sürekli okur, read() sadece en yeniyi döndürür
+        self.lock = threading.Condition()
+        self.latest = None  # (frame, timestamp)
+        self.latest_id = 0
+        self.read_id = 0
+        self.dropped_frames = 0
+        self.thread_exited = False
+        if grab_latest:
+            self.thread = threading.Thread(target=self._grab_loop, daemon=True)
+            self.thread.start()
+    
+    def isOpened(self):
+        return self.cap.isOpened()
+    
+    def _capture_timestamp(self):
+        """Kare yakalama zamanı - V4L2 tampon zaman damgası (CLOCK_MONOTONIC) veya grab anı"""
+        now = time.monotonic()
+        if self.backend == "v4l2":
+            hw_ts = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+            # Donanım zaman damgası farklı bir saat tabanındaysa kullanma
+            if hw_ts > 0 and 0 <= now - hw_ts < 1.0:
+                return hw_ts
+        return now
+    
+    def _grab(self):
+        if not self.cap.grab():
+            return None
+        timestamp = self._capture_timestamp()
+        ret, frame = self.cap.retrieve()
+        if not ret:
+            return None
+        return frame, timestamp
+    
+    def _grab_loop(self):
+        while not self.stopped:
+            grabbed = self._grab()
+            with self.lock:
+                if grabbed is None:
+                    self.stopped = True
+                else:
+                    if self.latest_id > self.read_id:
+                        self.dropped_frames += 1  # Okunmadan üzerine yazılan eski kare
+                    self.latest = grabbed
+                    self.latest_id += 1
+                self.lock.notify_all()
+        
+        # release() beklerken çıkamadıysak yakalamayı thread kendisi kapatır
+        with self.lock:
+            self.thread_exited = True
+            release = self.release_pending
+        if release:
+            self.cap.release()
+    
+    def read(self):
+        if not self.grab_latest:
+            grabbed = self._grab()
+            if grabbed is None:
+                return False, None, None
+            return True, grabbed[0], grabbed[1]
+        
+        with self.lock:
+            # Yeni bir kare gelene kadar bekle - aynı kareyi iki kez işleme
+            # (ilk MJPEG karesi 1 saniyeden uzun sürebilir, thread durmadıkça beklemeye devam et)
+            self.lock.wait_for(lambda: self.latest_id > self.read_id or self.stopped)
+            if self.latest_id <= self.read_id:
+                return False, None, None
+            self.read_id = self.latest_id
+            frame, timestamp = self.latest
+        return True, frame, timestamp
+    
+    def release(self):
+        self.stopped = True
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            print(f"📷 İşlenmeden atlanan eski kare: {self.dropped_frames}")
+            with self.lock:
+                if not self.thread_exited:
+                    # Thread hâlâ grab() içinde - yakalamayı altından serbest bırakma
+                    self.release_pending = True
+                    print("⚠️ Yakalama thread'i durmadı, kamera thread çıkınca kapatılacak")
+                    return
+        self.cap.release()
+
+class VideoFileSource(FrameSource):
+    """Video dosyasından kare kaynağı - test için kamera ile aynı arayüz"""
+    def __init__(self, path, width=1280, height=720, realtime=True, loop=True):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.realtime = realtime
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+        fps = self.cap.get(cv2.CAP_PROP_FPS) if self.cap.isOpened() else 0
+        self.frame_interval = 1.0 / fps if fps > 0 else 1.0 / 30
+        self.next_frame_time = time.monotonic()
+    
+    def isOpened(self):
+        return self.cap.isOpened()
+    
+    def read(self):
+        ret, frame = self.cap.read()
+        if not ret and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        if not ret:
+            return False, None, None
+        
+        if self.realtime:
+            # Dosyanın kendi FPS'inde oynat
+            delay = self.next_frame_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.next_frame_time = max(self.next_frame_time, time.monotonic() - self.frame_interval) + self.frame_interval
+        
+        if frame.shape[1] != self.width or frame.shape[0] != self.height:
+            frame = cv2.resize(frame, (self.width, self.height), interpolation=cv2.INTER_LINEAR)
+        return True, frame, time.monotonic()
+    
+    def release(self):
+        self.cap.release()
+
+class SyntheticSource(FrameSource):
+    """Yapay bullseye görüntüsü üreten kare kaynağı - kamerasız test için"""
+    def __init__(self, width=1280, height=720, fps=30, target_radius=40):
+        self.width = width
+        self.height = height
+        self.frame_interval = 1.0 / fps
+        self.target_radius = target_radius
+        self.start_time = time.monotonic()
+        self.next_frame_time = self.start_time
+        self.background = np.full((height, width, 3), 60, dtype=np.uint8)
+    
+    def read(self):
+        delay = self.next_frame_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_frame_time = max(self.next_frame_time, time.monotonic() - self.frame_interval) + self.frame_interval
+        
+        timestamp = time.monotonic()
+        t = timestamp - self.start_time
+        
+        # Lissajous yolunda yavaşça hareket eden hedef
+        cx = int(self.width / 2 + self.width * 0.3 * math.sin(0.5 * t))
+        cy = int(self.height / 2 + self.height * 0.3 * math.sin(0.7 * t))
+        
+        frame = self.background.copy()
+        for i in range(4, 0, -1):
+            color = (0, 0, 255) if i % 2 == 0 else (255, 255, 255)
+            cv2.circle(frame, (cx, cy), self.target_radius * i // 4, color, -1)
+        return True, frame, timestamp
 
 class PanTiltController:
     def __init__(self, esp32_ip="192.168.43.185"):
         self.esp32_ip = esp32_ip
         self.camera = None
         self.running = False
+        self.frame_timestamp = time.monotonic()  # Son karenin yakalama zamanı (monotonic)
         self.bullseye_tracking = False  # Bullseye takibi modu
         
         # Kamera çözünürlüğü
         self.frame_width = 1280
         self.frame_height = 720
         
+        # Yakalama ayarları
+        self.capture_backend = "v4l2" if sys.platform.startswith("linux") else "any"
+        self.capture_fourcc = "MJPG"  # MJPEG - ham YUYV 1280x720'de düşük FPS verir
+        self.capture_fps = 30
+        self.capture_buffer_size = 1
+        self.capture_grab_latest = True  # Her zaman en son kareyi işle
+        self.capture_exposure = None  # Pozlama sınırı (None = otomatik)
+        
         # Hassas servo kontrolü için float pozisyonlar - YENİ MERKEZ
         self.current_pan = 114.0  # Yeni merkez pan değeri
         self.current_tilt = 14.0  # Yeni merkez tilt değeri
@@ -52,6 +856,27 @@ class PanTiltController:
         self.confidence_threshold = 0.5
         self.bullseye_class_name = "bullseye"
         
+        # Uyarlanabilir çıkarım zamanlayıcısı (gecikme bütçesi)
+        self.adaptive_inference = True
+        self.scheduler = InferenceScheduler(frame_budget=1.0 / 30)
+        
+        # Çok süreçli çıkarım (0 = ana süreçte çalıştır, --workers N ile ayarlanır)
+        self.inference_workers = 0
+        self.worker_pool = None
+        self.pending_frames = {}  # frame_id -> (yakalama zamanı, önbellek imzası, roi)
+        
+        # Değişmeyen karelerde tespit önbelleği (kilitli ve hareketsizken)
+        self.detection_cache_enabled = True
+        self.detection_cache = DetectionCache()
+        
+        # HUD katmanı (saklı mod) ve gösterim ölçeği
+        self.hud = None
+        self.display_scale = 1.0  # < 1.0 ise HUD gösterim çözünürlüğünde bindirilir
+        
+        # Karo tarama - arama sırasında küçük/uzak hedefler için
+        self.tiled_detection = True
+        self.last_detection_tiled = False
+        
         # Hedef kilitleme sistemi
         self.target_locked = False
         self.target_box = None  # Hedef bullseye'ın kutusu
@@ -66,13 +891,32 @@ class PanTiltController:
         self.bullseye_move_interval = 0.2  # Hareket aralığı
         
         # Kayıp hedef takip sistemi - YENİ
-        self.last_bullseye_detection_time = time.time()
+        self.last_bullseye_detection_time = time.monotonic()
         self.last_known_target_center = None  # Son bilinen hedef merkezi
         self.target_lost_time = None  # Hedefin kaybolduğu zaman
         self.continue_tracking_duration = 3.0  # 3 saniye boyunca son yöne bakmaya devam et
         self.no_bullseye_timeout = 5.0
         self.lost_target_recovery = False
         
+        # Servo hareketi (slew) sırasında kare eleme
+        self.servo_speed = 300.0  # derece/saniye - MG995 ~0.2s/60° (yüksüz, 4.8V)
+        self.servo_settle_margin = 0.08  # Mekanik salınımın sönmesi için ek süre (s)
+        self.slew_gating_mode = "skip"  # "skip": çıkarımı atla, "downweight": düşük kazanç, "off"
+        self.slew_weight = 0.3  # downweight modunda takip kazancı
+        self.servo_settle_until = 0.0  # Son komutun tahmini yerleşme zamanı (monotonic)
+        self.last_servo_command_time = 0.0
+        # Son gönderilen komut - çağıranlar current_pan/tilt'i gönderimden önce değiştirebilir
+        self.commanded_pan = self.current_pan
+        self.commanded_tilt = self.current_tilt
+        self.frame_mid_slew = False
+        self.slew_was_active = False
+        self.slew_skipped_frames = 0
+        self.slew_total_frames = 0
+        
+        # Kilitlenme süresi ölçümü (slew eleme modlarını karşılaştırmak için)
+        self.acquire_start_time = None
+        self.acquire_times = {}  # mod -> [süre, ...]
+        
         # Servo sınırları - Güncellenmiş
         self.pan_min = 30
         self.pan_max = 290
@@ -89,15 +933,22 @@ class PanTiltController:
         microseconds = max(self.SERVO_MIN_US, min(self.SERVO_MAX_US, microseconds))
         return ((microseconds - self.SERVO_MIN_US) / (self.SERVO_MAX_US - self.SERVO_MIN_US)) * 180.0
 
-    def initialize_camera(self, camera_index=1):
-        """Kamerayı başlat"""
-        self.camera = cv2.VideoCapture(camera_index)
+    def initialize_camera(self, camera_index=1, source=None):
+        """Kamerayı başlat - source verilirse (dosya/yapay) onu kullan"""
+        if source is not None:
+            self.camera = source
+        else:
+            self.camera = CameraSource(camera_index, self.frame_width, self.frame_height,
+                                       fps=self.capture_fps,
+                                       backend=self.capture_backend,
+                                       fourcc=self.capture_fourcc,
+                                       buffer_size=self.capture_buffer_size,
+                                       grab_latest=self.capture_grab_latest,
+                                       exposure=self.capture_exposure)
         if not self.camera.isOpened():
             print(f"Kamera {camera_index} açılamadı!")
             return False
             
-        self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_width)
-        self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
         print("Kamera başlatıldı")
         return True
     
@@ -162,8 +1013,20 @@ class PanTiltController:
                     
                     print(f"📡 Derece gönderiliyor - Pan: {pan:.2f}° ({self.current_pan_us}μs) | Tilt: {tilt:.2f}° ({self.current_tilt_us}μs)")
                 
+                # Gönderimden önce - yanıt zaman aşımına uğrasa da ESP32 komutu uygulamış olabilir
+                move_deg = max(abs(self.current_pan - self.commanded_pan), abs(self.current_tilt - self.commanded_tilt))
+                self.commanded_pan = self.current_pan
+                self.commanded_tilt = self.current_tilt
+                settle_time = move_deg / self.servo_speed + self.servo_settle_margin
+                self.last_servo_command_time = time.monotonic()
+                self.detection_cache.invalidate()
+                self.servo_settle_until = max(self.servo_settle_until, self.last_servo_command_time + settle_time)
+                
                 response = requests.post(url, data=data, timeout=2)
                 
+                # Onay alındı - hareket en geç şimdi başladı, yerleşme zamanını onaydan itibaren uzat
+                self.servo_settle_until = max(self.servo_settle_until, time.monotonic() + settle_time)
+                
             else:
                 url = f"http://{self.esp32_ip}/status"
                 response = requests.get(url, timeout=2)
@@ -270,7 +1133,7 @@ class PanTiltController:
         return (left_point >= target_left and right_point <= target_right and
                 top_point >= target_top and bottom_point <= target_bottom)
     
-    def track_to_target_center(self, center_x, center_y):
+    def track_to_target_center(self, center_x, center_y, gain=1.0):
         """Hedefi merkeze getir - ULTRA hassas takip"""
         frame_center_x = self.frame_width // 2
         frame_center_y = self.frame_height // 2
@@ -298,8 +1161,8 @@ class PanTiltController:
             sensitivity *= 1.2
             step_multiplier = 1.5
         
-        pan_change = diff_x * sensitivity * step_multiplier
-        tilt_change = diff_y * sensitivity * step_multiplier
+        pan_change = diff_x * sensitivity * step_multiplier * gain
+        tilt_change = diff_y * sensitivity * step_multiplier * gain
         
         if abs(pan_change) < 0.05:
             pan_change = 0
@@ -427,34 +1290,173 @@ class PanTiltController:
         
         print("Hassas ayarlama modundan çıkıldı.")
     
+    def boxes_to_detections(self, boxes):
+        """(x1, y1, x2, y2, güven) kutularını tespit sözlüklerine çevir"""
+        bullseye_detections = []
+        
+        for x1, y1, x2, y2, confidence in boxes:
+            width = x2 - x1
+            height = y2 - y1
+            center_x = int(x1 + width / 2)
+            center_y = int(y1 + height / 2)
+                        
+            bullseye_detections.append({
+                'bbox': (int(x1), int(y1), int(width), int(height)),
+                'center': (center_x, center_y),
+                'confidence': confidence,
+                'size': max(width, height)
+            })
+        
+        return bullseye_detections
+    
+    def run_inference(self, frame, imgsz=None, roi=None):
+        """YOLO çıkarımı - roi verilirse sadece o bölgede, kutular tam kare koordinatında"""
+        boxes = infer_bullseye_boxes(frame, self.confidence_threshold, self.bullseye_class_name, imgsz, roi)
+        return self.boxes_to_detections(boxes)
+    
+    def is_small_unlocked_target(self):
+        """Hedef görünür ama kilitlenemeyecek kadar küçük mü (DZ/Target oranı eşiğin üstünde)"""
+        if self.target_box is None or self.target_locked or self.target_lost_time is not None:
+            return False
+        lock_size = (self.dead_zone_size * 2) / self.zoom_in_threshold
+        return max(self.target_box[2], self.target_box[3]) < lock_size
+    
+    def detect_bullseyes(self, frame):
+        """Bu kare için bullseye tespitleri - yeni sonuç yoksa None"""
+        # Servolar hâlâ hareket ediyorsa kare bulanık ve kaymış
+        self.slew_total_frames += 1
+        self.frame_mid_slew = (self.slew_gating_mode != "off" and
+                               self.frame_timestamp < self.servo_settle_until)
+        if self.frame_mid_slew:
+            self.slew_was_active = True
+            if self.slew_gating_mode == "skip":
+                self.slew_skipped_frames += 1
+                return None
+        elif self.slew_was_active:
+            # İlk yerleşmiş kare - boşalan CPU ile tam çözünürlükte tara
+            self.slew_was_active = False
+            self.scheduler.boost_next_frame()
+        
+        # Kilitli, hareketsiz ve sahne değişmediyse önceki sonucu kullan
+        cache_entry = None
+        if (self.detection_cache_enabled and self.target_locked and self.target_box is not None
+                and not self.frame_mid_slew and self.target_lost_time is None):
+            cached = self.detection_cache.lookup(frame, self.zoom_level, self.frame_timestamp)
+            if cached is not None:
+                return cached
+            cache_roi = self.detection_cache.region(self.target_box, frame.shape)
+            cache_entry = (self.detection_cache.signature(frame, cache_roi), cache_roi,
+                           self.zoom_level, self.frame_timestamp)
+        
+        # Karo taramada bulunan küçük hedef - tam kare küçültmesinde kaybolur, ROI'de izle
+        small_target = self.is_small_unlocked_target()
+        
+        imgsz, roi = None, None
+        if small_target:
+            imgsz, roi = self.scheduler.plan_native_roi(self.target_box, frame.shape)
+        elif self.adaptive_inference:
+            imgsz, roi = self.scheduler.plan(self.target_box, self.target_locked, frame.shape)
+        
+        # Hedef yok veya kayıp - tek geçişte küçük hedefleri bulmak için karo tarama (bütçe izin verirse)
+        tiles = None
+        if self.tiled_detection and (self.target_box is None or self.target_lost_time is not None):
+            tiles = self.scheduler.tile_plan() if self.adaptive_inference else (640, 640)
+        self.last_detection_tiled = tiles is not None
+        
+        if self.worker_pool is not None and self.worker_pool.accepts(frame):
+            # Önce tamamlananları al (slotlar boşalır), sonra bu kareyi gönder
+            completed = self.worker_pool.collect()
+            if self.worker_pool.failed:
+                # İşçi öldü - havuzu kapat, bu kareden itibaren ana süreçte çıkarım
+                self.worker_pool.close()
+                self.worker_pool = None
+                self.pending_frames.clear()
+            else:
+                frame_id = self.worker_pool.submit(frame, self.confidence_threshold, self.bullseye_class_name,
+                                                   imgsz, roi, tiles)
+                if frame_id is not None:
+                    self.pending_frames[frame_id] = (self.frame_timestamp, cache_entry, roi)
+                fresh = []
+                for frame_id, boxes, infer_time in completed:
+                    capture_time, entry, result_roi = self.pending_frames.pop(frame_id, (0.0, None, None))
+                    if entry is not None and result_roi is not None:
+                        # Önbellek isabeti sadece kilitli ROI çıkarımının yerini tutar
+                        self.detection_cache.record_inference_time(infer_time)
+                    # Son servo komutundan önce yakalanan karelerin konumları artık geçersiz
+                    if capture_time >= self.last_servo_command_time:
+                        fresh.append((boxes, entry, result_roi))
+                if not fresh:
+                    return None
+                boxes, entry, result_roi = fresh[-1]
+                if result_roi is not None and len(boxes) == 0:
+                    # Sonucun ROI'sinde hedef yok - sonraki karede tam kare tara
+                    self.scheduler.force_full_frame()
+                bullseye_detections = self.boxes_to_detections(boxes)
+                if entry is not None and entry[2] == self.zoom_level:
+                    self.detection_cache.store(entry[0], entry[1], bullseye_detections, entry[2], entry[3])
+                return bullseye_detections
+        
+        start = time.monotonic()
+        locked_roi = cache_entry is not None and roi is not None
+        if tiles is not None:
+            boxes = infer_bullseye_boxes_tiled(frame, self.confidence_threshold, self.bullseye_class_name, *tiles)
+            bullseye_detections = self.boxes_to_detections(boxes)
+        else:
+            bullseye_detections = self.run_inference(frame, imgsz, roi)
+            if locked_roi and len(bullseye_detections) > 0:
+                # Önbellek isabeti sadece kilitli ROI çıkarımının yerini tutar
+                self.detection_cache.record_inference_time(time.monotonic() - start)
+            if roi is not None and len(bullseye_detections) == 0:
+                # ROI'de hedef yok - aynı karede geri dön (küçük hedef için karo, yoksa tam kare)
+                fallback_tiles = self.scheduler.tile_plan() if self.adaptive_inference else (640, 640)
+                if small_target and self.tiled_detection and fallback_tiles is not None:
+                    boxes = infer_bullseye_boxes_tiled(frame, self.confidence_threshold, self.bullseye_class_name,
+                                                       *fallback_tiles)
+                    bullseye_detections = self.boxes_to_detections(boxes)
+                else:
+                    full_imgsz = self.scheduler.last_full_imgsz if self.adaptive_inference else None
+                    bullseye_detections = self.run_inference(frame, full_imgsz)
+        
+        if cache_entry is not None:
+            self.detection_cache.store(cache_entry[0], cache_entry[1], bullseye_detections,
+                                       cache_entry[2], cache_entry[3])
+        return bullseye_detections
+    
+    def draw_target_box(self, frame, target_box):
+        """Hedef kutusu ve merkez noktası (yazılar arayüzde)"""
+        x, y, w, h = target_box
+        if self.target_locked:
+            color = (0, 255, 0)
+            thickness = 3
+        else:
+            color = (0, 255, 255)
+            thickness = 2
+        
+        cv2.rectangle(frame, (x, y), (x + w, y + h), color, thickness)
+        cv2.circle(frame, (x + w // 2, y + h // 2), 5, (0, 255, 0), -1)
+    
+    def draw_dead_zone(self, frame):
+        """Dead zone çizimi - Dairesel"""
+        frame_center_x = self.frame_width // 2
+        frame_center_y = self.frame_height // 2
+        dz_color = (0, 255, 0) if self.target_locked else (0, 255, 255)
+        cv2.circle(frame, 
+                  (frame_center_x, frame_center_y),
+                  self.dead_zone_size,
+                  dz_color, 2 if self.target_locked else 1)
+    
     def detect_and_track_bullseye(self, frame):
         """YOLO ile bullseye tanıma ve gelişmiş kilitleme sistemi"""
-        results = model(frame, conf=self.confidence_threshold, verbose=False)
+        bullseye_detections = self.detect_bullseyes(frame)
         
-        current_time = time.time()
-        bullseye_detections = []
+        if bullseye_detections is None:
+            # Yeni sonuç yok - takip durumu değişmez, son hedef kutusunu çiz
+            if self.target_box is not None and self.target_lost_time is None:
+                self.draw_target_box(frame, self.target_box)
+            self.draw_dead_zone(frame)
+            return frame
         
-        for result in results:
-            boxes = result.boxes
-            if boxes is not None:
-                for box in boxes:
-                    class_id = int(box.cls[0])
-                    class_name = model.names[class_id]
-                    confidence = float(box.conf[0])
-                    
-                    if class_name.lower() == self.bullseye_class_name.lower() or "bullseye" in class_name.lower():
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        width = x2 - x1
-                        height = y2 - y1
-                        center_x = int(x1 + width / 2)
-                        center_y = int(y1 + height / 2)
-                        
-                        bullseye_detections.append({
-                            'bbox': (int(x1), int(y1), int(width), int(height)),
-                            'center': (center_x, center_y),
-                            'confidence': confidence,
-                            'size': max(width, height)
-                        })
+        current_time = self.frame_timestamp
         
         if len(bullseye_detections) > 0:
             # Hedef bulundu
@@ -487,16 +1489,25 @@ class PanTiltController:
                     self.zoom_level = max(self.zoom_min, self.zoom_level - 0.05)
                     print(f"🔍 Zoom OUT: {self.zoom_level:.1f}x (Hedef büyük, DZ/Target oranı: {deadzone_to_target_ratio:.2f})")
             
+            # Hareket sırasındaki karelerde düşük kazanç (downweight modu)
+            gain = self.slew_weight if self.frame_mid_slew else 1.0
+            
             # Kilitleme kontrolü
             if not self.target_locked:
+                if self.acquire_start_time is None:
+                    self.acquire_start_time = current_time
+                
                 # Hedef boyutu ve deadzone içinde olma kontrolü
                 if deadzone_to_target_ratio <= self.zoom_in_threshold and self.is_dead_zone_inside_target(self.target_box):
                     self.target_locked = True
-                    print("🎯 HEDEF KİLİTLENDİ!")
+                    acquire_time = current_time - self.acquire_start_time
+                    self.acquire_times.setdefault(self.slew_gating_mode, []).append(acquire_time)
+                    self.acquire_start_time = None
+                    print(f"🎯 HEDEF KİLİTLENDİ! ({acquire_time:.2f}s)")
                 else:
                     # Hedefi merkeze getir
                     if (current_time - self.last_bullseye_move_time) > self.bullseye_move_interval:
-                        self.track_to_target_center(center_x, center_y)
+                        self.track_to_target_center(center_x, center_y, gain)
                         self.last_bullseye_move_time = current_time
             else:
                 # Kilit kontrolü
@@ -512,19 +1523,11 @@ class PanTiltController:
                     
                     if dist_x > 5 or dist_y > 5:
                         if (current_time - self.last_bullseye_move_time) > self.bullseye_move_interval * 2:
-                            self.track_to_target_center(center_x, center_y)
+                            self.track_to_target_center(center_x, center_y, gain)
                             self.last_bullseye_move_time = current_time
             
             # Sadece kutu çizimi (yazılar arayüzde)
-            if self.target_locked:
-                color = (0, 255, 0)
-                thickness = 3
-            else:
-                color = (0, 255, 255)
-                thickness = 2
-            
-            cv2.rectangle(frame, (x, y), (x + w, y + h), color, thickness)
-            cv2.circle(frame, (center_x, center_y), 5, (0, 255, 0), -1)
+            self.draw_target_box(frame, self.target_box)
             
         else:
             # Hedef kayıp
@@ -544,6 +1547,7 @@ class PanTiltController:
                 # 3 saniye geçti veya daha uzun süre kayıp
                 self.target_locked = False
                 self.target_box = None
+                self.acquire_start_time = None
                 
                 time_since_last_bullseye = current_time - self.last_bullseye_detection_time
                 
@@ -554,113 +1558,141 @@ class PanTiltController:
                     self.lost_target_recovery = True
         
         # Dead zone çizimi - Dairesel
-        frame_center_x = self.frame_width // 2
-        frame_center_y = self.frame_height // 2
-        dz_color = (0, 255, 0) if self.target_locked else (0, 255, 255)
-        cv2.circle(frame, 
-                  (frame_center_x, frame_center_y),
-                  self.dead_zone_size,
-                  dz_color, 2 if self.target_locked else 1)
+        self.draw_dead_zone(frame)
         
         return frame
     
-    def draw_interface(self, frame):
-        """Geliştirilmiş arayüz çizimi - TÜM YAZILAR SOL ÜSTTE"""
+    def build_hud(self, width, height):
+        """HUD katmanını oluştur - artı işareti ve kontrol listesi bir kez çizilir"""
+        hud = HudOverlay(width, height, width / float(self.frame_width))
+        
         center_x = self.frame_width // 2
         center_y = self.frame_height // 2
-        cv2.line(frame, (center_x - 20, center_y), (center_x + 20, center_y), (0, 255, 0), 2)
-        cv2.line(frame, (center_x, center_y - 20), (center_x, center_y + 20), (0, 255, 0), 2)
+        hud.static_line((center_x - 20, center_y), (center_x + 20, center_y), (0, 255, 0), 2)
+        hud.static_line((center_x, center_y - 20), (center_x, center_y + 20), (0, 255, 0), 2)
+        
+        # Kontroller (sol alt köşede)
+        y_start = self.frame_height - 260
+        hud.static_text("KONTROLLER:", (10, y_start), 0.5, (255, 255, 255), 1)
+        legend = [
+            ("W/A/S/D: Manuel hareket", (255, 255, 255)),
+            ("[ / ]: Adım boyutunu azalt/arttır", (0, 255, 255)),
+            ("SPACE: Bullseye takip modu", (0, 255, 0)),
+            ("+ / -: Manuel zoom", (255, 255, 0)),
+            ("C: Merkeze dön", (255, 255, 255)),
+            ("T/G: YOLO güven ayarı", (255, 0, 255)),
+            ("R: Zoom reset", (255, 255, 0)),
+            ("M: Mikrosaniye/Derece modu", (255, 255, 0)),
+            ("F: Hassas ayarlama modu", (0, 255, 255)),
+            ("K: Kalibrasyon", (255, 0, 255)),
+            ("P: Pozisyon bilgisi", (0, 255, 255)),
+            ("B: Uyarlanabilir çıkarım", (255, 255, 255)),
+            ("V: Slew eleme modu", (255, 255, 255)),
+            ("X: Karo tarama", (255, 255, 255)),
+            ("Q: Çıkış", (255, 0, 0)),
+        ]
+        for index, (text, color) in enumerate(legend):
+            hud.static_text(text, (10, y_start + 20 + index * 15), 0.4, color, 1)
         
-        # Sol üst köşede bilgi paneli
+        hud.finish_static()
+        self.hud = hud
+    
+    def draw_interface(self, frame, minimal=False):
+        """Geliştirilmiş arayüz çizimi - TÜM YAZILAR SOL ÜSTTE"""
+        if self.hud is None or (self.hud.height, self.hud.width) != frame.shape[:2]:
+            self.build_hud(frame.shape[1], frame.shape[0])
+        
+        # Performans bilgisi (sağ üst köşede)
+        perf_fmt = "FPS: {:.1f} | Aşım: {}"
+        perf_values = [round(self.scheduler.fps, 1), self.scheduler.budget_misses]
+        if self.bullseye_tracking and self.detection_cache_enabled:
+            perf_fmt += " | Önbellek: %{}"
+            perf_values.append(int(round(self.detection_cache.hit_rate() * 100)))
+        if self.bullseye_tracking and self.last_detection_tiled:
+            perf_fmt += " | Karo tarama"
+        elif self.bullseye_tracking and self.adaptive_inference:
+            perf_fmt += " | imgsz: {} ({})"
+            perf_values += [self.scheduler.last_imgsz, "ROI" if self.scheduler.last_use_roi else "Tam"]
+        self.hud.set_text("perf", perf_fmt, tuple(perf_values), (self.frame_width - 10, 30),
+                          0.5, (255, 255, 255), 1, align="right")
+        
+        # Bütçe aşıldı - panel son haliyle kalır, güncellenmez
+        if minimal:
+            return self.hud.composite(frame)
+        
+        # Sol üst köşede bilgi paneli - (format, değerler, konum, ölçek, renk, kalınlık)
+        rows = []
         y_offset = 30
         line_height = 20
         
         # Mod bilgisi
         mode_text = "BULLSEYE TAKİP" if self.bullseye_tracking else "MANUEL KONTROL"
         mode_color = (0, 255, 0) if self.bullseye_tracking else (255, 255, 255)
-        cv2.putText(frame, mode_text, (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.7, mode_color, 2)
+        rows.append((mode_text, (), (10, y_offset), 0.7, mode_color, 2))
         y_offset += line_height + 5
         
         # Pozisyon bilgisi
-        cv2.putText(frame, f"Pan: {self.current_pan:.2f}° ({self.current_pan_us}μs)", 
-                   (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        rows.append(("Pan: {:.2f}° ({}μs)", (self.current_pan, self.current_pan_us),
+                     (10, y_offset), 0.5, (255, 255, 255), 1))
         y_offset += line_height
         
-        cv2.putText(frame, f"Tilt: {self.current_tilt:.2f}° ({self.current_tilt_us}μs)", 
-                   (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        rows.append(("Tilt: {:.2f}° ({}μs)", (self.current_tilt, self.current_tilt_us),
+                     (10, y_offset), 0.5, (255, 255, 255), 1))
         y_offset += line_height
         
         # Kontrol bilgileri
-        cv2.putText(frame, f"Adım: {self.step_size:.2f}°" if not self.use_micros_mode else f"Adım: {self.micros_step}μs", 
-                   (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+        if self.use_micros_mode:
+            rows.append(("Adım: {}μs", (self.micros_step,), (10, y_offset), 0.5, (0, 255, 255), 1))
+        else:
+            rows.append(("Adım: {:.2f}°", (self.step_size,), (10, y_offset), 0.5, (0, 255, 255), 1))
         y_offset += line_height
         
-        cv2.putText(frame, f"Zoom: {self.zoom_level:.1f}x", 
-                   (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+        rows.append(("Zoom: {:.1f}x", (self.zoom_level,), (10, y_offset), 0.5, (255, 255, 0), 1))
         y_offset += line_height
         
         # Hedef bilgileri (bullseye modundaysa)
         if self.bullseye_tracking:
             lock_text = "🔒 KİLİTLİ" if self.target_locked else "🔓 KİLİTSİZ"
             lock_color = (0, 255, 0) if self.target_locked else (0, 0, 255)
-            cv2.putText(frame, lock_text, (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.6, lock_color, 2)
+            rows.append((lock_text, (), (10, y_offset), 0.6, lock_color, 2))
             y_offset += line_height
             
             # Hedef bilgisi varsa
             if self.target_box:
                 x, y, w, h = self.target_box
-                cv2.putText(frame, f"Hedef Boyut: {w:.0f}x{h:.0f}px", 
-                           (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+                rows.append(("Hedef Boyut: {:.0f}x{:.0f}px", (w, h), (10, y_offset), 0.5, (0, 255, 255), 1))
                 y_offset += line_height
                 
                 # Oran bilgisi - DÜZELTILMIŞ
                 deadzone_to_target_ratio = (self.dead_zone_size * 2) / max(w, h) if max(w, h) > 0 else float('inf')
                 ratio_color = (0, 255, 0) if deadzone_to_target_ratio <= self.zoom_in_threshold else (0, 0, 255)
-                cv2.putText(frame, f"DZ/Target Oranı: {deadzone_to_target_ratio:.2f} (Hedef: ≤0.7)", 
-                           (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.5, ratio_color, 1)
+                rows.append(("DZ/Target Oranı: {:.2f} (Hedef: ≤0.7)", (round(deadzone_to_target_ratio, 2),),
+                             (10, y_offset), 0.5, ratio_color, 1))
                 y_offset += line_height
             
             # Hedef kayıpsa süre bilgisi
             if self.target_lost_time:
-                time_since_lost = time.time() - self.target_lost_time
+                time_since_lost = time.monotonic() - self.target_lost_time
                 if time_since_lost < self.continue_tracking_duration:
                     remaining = self.continue_tracking_duration - time_since_lost
-                    cv2.putText(frame, f"Son yöne bakılıyor: {remaining:.1f}s", 
-                               (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+                    rows.append(("Son yöne bakılıyor: {:.1f}s", (round(remaining, 1),),
+                                 (10, y_offset), 0.5, (255, 255, 0), 1))
                     y_offset += line_height
         
         # YOLO güven seviyesi
-        cv2.putText(frame, f"YOLO Güven: {self.confidence_threshold:.1f}", 
-                   (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        rows.append(("YOLO Güven: {:.1f}", (self.confidence_threshold,), (10, y_offset), 0.4, (255, 255, 255), 1))
         y_offset += line_height
         
         # Dead Zone boyutu
-        cv2.putText(frame, f"Dead Zone: {self.dead_zone_size}px (sabit)", 
-                   (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
+        rows.append(("Dead Zone: {}px (sabit)", (self.dead_zone_size,), (10, y_offset), 0.4, (0, 255, 255), 1))
         y_offset += line_height
         
         # Kontrol modu
         mode = "MİKROSANİYE" if self.use_micros_mode else "DERECE"
-        cv2.putText(frame, f"Kontrol: {mode}", 
-                   (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 0), 1)
-        
-        # Kontroller (sağ alt köşede)
-        y_start = frame.shape[0] - 260
-        cv2.putText(frame, "KONTROLLER:", (10, y_start), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        cv2.putText(frame, "W/A/S/D: Manuel hareket", (10, y_start + 20), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-        cv2.putText(frame, "[ / ]: Adım boyutunu azalt/arttır", (10, y_start + 35), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
-        cv2.putText(frame, "SPACE: Bullseye takip modu", (10, y_start + 50), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 0), 1)
-        cv2.putText(frame, "+ / -: Manuel zoom", (10, y_start + 65), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 0), 1)
-        cv2.putText(frame, "C: Merkeze dön", (10, y_start + 80), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-        cv2.putText(frame, "T/G: YOLO güven ayarı", (10, y_start + 95), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 0, 255), 1)
-        cv2.putText(frame, "R: Zoom reset", (10, y_start + 110), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 0), 1)
-        cv2.putText(frame, "M: Mikrosaniye/Derece modu", (10, y_start + 125), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 0), 1)
-        cv2.putText(frame, "F: Hassas ayarlama modu", (10, y_start + 140), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
-        cv2.putText(frame, "K: Kalibrasyon", (10, y_start + 155), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 0, 255), 1)
-        cv2.putText(frame, "P: Pozisyon bilgisi", (10, y_start + 170), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
-        cv2.putText(frame, "Q: Çıkış", (10, y_start + 185), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 0, 0), 1)
+        rows.append(("Kontrol: {}", (mode,), (10, y_offset), 0.4, (255, 255, 0), 1))
         
-        return frame
+        self.hud.set_lines("panel", rows)
+        return self.hud.composite(frame)
     
     def center_camera(self):
         """Kamerayı merkeze getir - YENİ MERKEZ DEĞERLERİ"""
@@ -670,16 +1702,34 @@ class PanTiltController:
         self.send_servo_command(self.current_pan, self.current_tilt)
         self.target_locked = False
         self.target_box = None
-        self.last_bullseye_detection_time = time.time()
+        self.last_bullseye_detection_time = time.monotonic()
         self.lost_target_recovery = False
         self.last_known_target_center = None
         self.target_lost_time = None
     
-    def run(self):
+    def print_slew_stats(self):
+        """Slew eleme istatistikleri ve moda göre ortalama kilitlenme süresi"""
+        skipped_pct = 100.0 * self.slew_skipped_frames / self.slew_total_frames if self.slew_total_frames else 0.0
+        print(f"🌀 Slew eleme: {self.slew_gating_mode.upper()} | Atlanan kare: "
+              f"{self.slew_skipped_frames}/{self.slew_total_frames} (%{skipped_pct:.1f})")
+        for mode, times in self.acquire_times.items():
+            print(f"   Kilitlenme süresi [{mode}]: ortalama {sum(times) / len(times):.2f}s ({len(times)} kilit)")
+    
+    def print_cache_stats(self):
+        """Tespit önbelleği isabet oranı ve tasarruf edilen çıkarım süresi"""
+        cache = self.detection_cache
+        print(f"💾 Tespit önbelleği: isabet %{cache.hit_rate() * 100:.1f} "
+              f"({cache.hits}/{cache.hits + cache.misses}) | "
+              f"Kazanılan CPU: ~{cache.saved_time:.1f}s (çıkarım başına {cache.avg_infer_time * 1000:.1f}ms)")
+    
+    def run(self, source=None):
         """Ana döngü - MG995 hassas kontrol versiyonu"""
-        if not self.initialize_camera():
+        if not self.initialize_camera(source=source):
             return
         
+        if self.inference_workers > 0:
+            self.worker_pool = InferenceWorkerPool(self.inference_workers)
+        
         cv2.namedWindow('MG995 Precision Bullseye Tracker')
         
         print("=" * 70)
@@ -704,6 +1754,9 @@ class PanTiltController:
         print("C: Merkeze dön")
         print("R: Zoom reset")
         print("T/G: YOLO güven seviyesi ayarı")
+        print("B: Uyarlanabilir çıkarım aç/kapat")
+        print("V: Slew eleme modu (skip/downweight/off)")
+        print("X: Karo tarama aç/kapat (arama modunda)")
         print("P: Pozisyon bilgisini göster")
         print("1-9: Hızlı pozisyonlama")
         print("Q: Çıkış")
@@ -712,22 +1765,37 @@ class PanTiltController:
         self.running = True
         
         while self.running:
-            ret, frame = self.camera.read()
+            ret, frame, timestamp = self.camera.read()
             if not ret:
                 print("Kamera görüntüsü alınamıyor!")
                 break
             
+            self.frame_timestamp = timestamp
+            
+            self.scheduler.begin_frame()
+            
             frame = self.apply_zoom(frame)
             
             if self.bullseye_tracking:
                 frame = self.detect_and_track_bullseye(frame)
             
-            frame = self.draw_interface(frame)
+            # HUD gerekirse sadece gösterim çözünürlüğünde bindirilir
+            display = frame
+            if self.display_scale != 1.0:
+                display = cv2.resize(frame, None, fx=self.display_scale, fy=self.display_scale,
+                                     interpolation=cv2.INTER_AREA)
+            
+            # Bütçe aşıldıysa HUD paneli güncellenmez
+            display = self.draw_interface(display, minimal=not self.scheduler.should_draw_hud())
             
-            cv2.imshow('MG995 Precision Bullseye Tracker', frame)
+            cv2.imshow('MG995 Precision Bullseye Tracker', display)
             
             key = cv2.waitKey(1) & 0xFF
             
+            if self.scheduler.end_frame() and self.bullseye_tracking:
+                self.print_slew_stats()
+                self.print_cache_stats()
+            
             if key == ord('q'):
                 self.running = False
             
@@ -763,6 +1831,8 @@ class PanTiltController:
                 print(f"  Tilt: {self.current_tilt:.2f}° ({self.current_tilt_us}μs)")
                 print(f"  Adım: {self.step_size:.2f}° veya {self.micros_step}μs")
                 print(f"  Mod:  {'Mikrosaniye' if self.use_micros_mode else 'Derece'}\n")
+                self.print_slew_stats()
+                self.print_cache_stats()
             
             elif key == ord(' '):
                 self.bullseye_tracking = not self.bullseye_tracking
@@ -772,7 +1842,7 @@ class PanTiltController:
                     self.target_box = None
                 else:
                     print("🎮 MANUEL KONTROL MODU AKTİF (Hassas kontrol)")
-                self.last_bullseye_detection_time = time.time()
+                self.last_bullseye_detection_time = time.monotonic()
                 self.lost_target_recovery = False
                 self.last_known_target_center = None
                 self.target_lost_time = None
@@ -797,14 +1867,36 @@ class PanTiltController:
                 self.confidence_threshold = max(0.1, self.confidence_threshold - 0.1)
                 print(f"YOLO güven seviyesi: {self.confidence_threshold:.1f}")
             
+            elif key == ord('v'):
+                modes = ["skip", "downweight", "off"]
+                self.slew_gating_mode = modes[(modes.index(self.slew_gating_mode) + 1) % len(modes)]
+                print(f"🌀 Slew eleme modu: {self.slew_gating_mode.upper()}")
+            
+            elif key == ord('x'):
+                self.tiled_detection = not self.tiled_detection
+                status = "AÇIK" if self.tiled_detection else "KAPALI"
+                print(f"🧩 Karo tarama: {status}")
+            
+            elif key == ord('b'):
+                self.adaptive_inference = not self.adaptive_inference
+                status = "AÇIK" if self.adaptive_inference else "KAPALI"
+                print(f"⏱️ Uyarlanabilir çıkarım: {status}")
+        
         
         self.cleanup()
     
     def cleanup(self):
         """Temizleme işlemleri"""
         print("Temizlik yapılıyor...")
+        self.print_slew_stats()
+        self.print_cache_stats()
+        if self.hud is not None:
+            print(f"🖼️ HUD: {self.scheduler.frame_count} karede {self.hud.renders} alan yeniden çizildi")
         if self.camera:
             self.camera.release()
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+            self.worker_pool = None
         cv2.destroyAllWindows()
         print("Program sonlandırıldı.")
 
@@ -814,8 +1906,22 @@ if __name__ == "__main__":
     
     controller = PanTiltController(esp32_ip)
     
+    # Test için: python bullseye_tracker.py [--workers N] [synthetic | <video dosyası>]
+    args = sys.argv[1:]
+    if "--workers" in args:
+        index = args.index("--workers")
+        controller.inference_workers = int(args[index + 1])
+        del args[index:index + 2]
+    
+    source = None
+    if args:
+        if args[0] == "synthetic":
+            source = SyntheticSource(controller.frame_width, controller.frame_height)
+        else:
+            source = VideoFileSource(args[0], controller.frame_width, controller.frame_height)
+    
     try:
-        controller.run()
+        controller.run(source)
     except KeyboardInterrupt:
         print("\nProgram sonlandırılıyor...")
         controller.cleanup()